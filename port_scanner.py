@@ -1,49 +1,482 @@
 #!/usr/bin/env python3
 import socket
 import argparse
-from rich.console import Console
+import asyncio
+import errno
+import functools
+import itertools
+import os
+import select
+import selectors
+import struct
+import threading
+import time
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.progress import Progress
-import time
-# --- NEW IMPORT for concurrency ---
+# --- Thread pool backs the --mode threaded backend ---
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Initialize rich console for beautiful output
 console = Console()
 
-def get_banner(s):
+# Pre-sorted port presets (aligned with nmap's --top-ports rankings), so
+# -p top100 binds a ready tuple instead of re-parsing a spec every run
+PRESETS = {
+    "top20": (
+        21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445, 993,
+        995, 1723, 3306, 3389, 5900, 8080,
+    ),
+    "top100": (
+        7, 9, 13, 21, 22, 23, 25, 26, 37, 53, 79, 80, 81, 88, 106, 110,
+        111, 113, 119, 135, 139, 143, 144, 179, 199, 389, 427, 443, 444,
+        445, 465, 513, 514, 515, 543, 544, 548, 554, 587, 631, 646, 873,
+        990, 993, 995, 1025, 1026, 1027, 1028, 1029, 1110, 1433, 1720,
+        1723, 1755, 1900, 2000, 2001, 2049, 2121, 2717, 3000, 3128, 3306,
+        3389, 3986, 4899, 5000, 5009, 5051, 5060, 5101, 5190, 5357, 5432,
+        5631, 5666, 5800, 5900, 6000, 6001, 6646, 7070, 8000, 8008, 8009,
+        8080, 8081, 8443, 8888, 9100, 9999, 10000, 32768, 49152, 49153,
+        49154, 49155, 49156, 49157,
+    ),
+    "web": (80, 443, 8000, 8008, 8080, 8081, 8443, 8888),
+}
+
+def parse_port_range(spec):
+    """
+    Parses a port specification like '80', '1-1024' or '22,80,8000-8080'
+    into a sorted list of unique ports. Ranges are kept as (start, end)
+    pairs and unioned through set() in one pass, so even 1-65535 never
+    builds an intermediate Python list.
+    Raises ValueError on malformed or out-of-range input.
+    """
+    ranges = []
+    singletons = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = map(int, part.split('-'))
+            if not (1 <= start <= end <= 65535):
+                raise ValueError(f"invalid port range: {part}")
+            ranges.append((start, end))
+        else:
+            port = int(part)
+            if not 1 <= port <= 65535:
+                raise ValueError(f"invalid port: {part}")
+            singletons.add(port)
+    expanded = set(itertools.chain.from_iterable(range(s, e + 1) for s, e in ranges))
+    return sorted(expanded | singletons)
+
+@functools.lru_cache(maxsize=4096)
+def _service_name(port):
+    """
+    Looks up the well-known service name for a TCP port.
+    Cached so repeated scans don't re-parse /etc/services per open port.
+    """
+    try:
+        return socket.getservbyport(port, 'tcp')
+    except OSError:
+        return "Unknown"
+
+# Banners arrive within one RTT or not at all; don't hold an open port
+# hostage for the whole connect timeout waiting for one
+BANNER_TIMEOUT = 0.3
+
+def get_banner(s, timeout=BANNER_TIMEOUT):
     """
     Attempts to grab the banner (service version) from an open port.
-    Returns the banner string or an empty string if it fails.
+    Waits for readability up to the banner deadline and reads once, so
+    chatty services answer in one round trip and silent ones cost only
+    the banner timeout. Returns the banner or an empty string.
     """
     try:
+        s.setblocking(False)
         # Some services send a banner immediately upon connection
-        banner = s.recv(1024).decode(errors='ignore').strip()
-        return banner
+        if not select.select([s], [], [], timeout)[0]:
+            return ""
+        return s.recv(1024).decode(errors='ignore').strip()
     except Exception:
         return ""
 
-def scan_port(ip, port, timeout):
+def _tune_socket(sock):
+    """
+    Sets per-socket options for scanning: linger-0 so close() sends RST
+    instead of FIN (no 60 s TIME_WAIT eating the ephemeral port range on
+    dense scans), and TCP_NODELAY so banner traffic isn't Nagle-delayed.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        # Best effort; not every platform/socket state accepts these
+        pass
+
+def _raise_fd_limit(needed):
+    """
+    Lifts the soft RLIMIT_NOFILE toward the hard limit when the scan can
+    hold more sockets in flight than the default soft cap (often 1024).
+    Running out of fds mid-scan makes socket() fail and ports get
+    misreported as closed. No-op where unsupported or already high.
+    """
+    try:
+        import resource
+    except ImportError:
+        # e.g. Windows; nothing to adjust
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    want = needed + 64  # in-flight sockets plus stdio/selector overhead
+    if soft < want:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(want, hard), hard))
+        except (ValueError, OSError):
+            # Hard limit too low or not permitted; the scan still runs,
+            # just with fewer usable fds
+            pass
+
+# Each worker thread keeps one selector so the epoll/kqueue fd is not
+# recreated on every scan_port call
+_thread_local = threading.local()
+
+def _get_selector():
+    """Returns this thread's reusable selector, creating it on first use."""
+    sel = getattr(_thread_local, "selector", None)
+    if sel is None:
+        sel = selectors.DefaultSelector()
+        _thread_local.selector = sel
+    return sel
+
+def scan_port(ip, port, timeout, family=socket.AF_INET):
     """
-    Scans a single port on the given IP address.
-    Returns a tuple: (port, is_open, banner)
+    Scans a single port on the given IP address using a non-blocking
+    connect. A closed port that answers with RST resolves immediately
+    instead of parking the thread for the full timeout.
+    Returns (port, banner) if the port is open, None otherwise — closed
+    ports are the overwhelming majority, and returning a shared None
+    beats allocating a result tuple for each of them.
     """
     try:
         # Create a new socket for each port scan
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            # Use connect_ex to avoid exceptions for closed ports
-            if s.connect_ex((ip, port)) == 0:
-                banner = get_banner(s)
-                # Return the port number along with the result
-                return port, True, banner
-    except socket.error as e:
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            _tune_socket(s)
+            s.setblocking(False)
+            # connect_ex avoids exceptions; EINPROGRESS/EWOULDBLOCK just
+            # means the handshake is still in flight
+            err = s.connect_ex((ip, port))
+            if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                return None
+            if err != 0:
+                # Wait for the socket to become writable (SYN-ACK or RST)
+                sel = _get_selector()
+                sel.register(s, selectors.EVENT_WRITE)
+                try:
+                    events = sel.select(timeout)
+                finally:
+                    sel.unregister(s)
+                if not events:
+                    # No answer within the timeout: closed or filtered
+                    return None
+                # Writable means the connect finished; SO_ERROR says how
+                if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                    return None
+            banner = get_banner(s)
+            return port, banner
+    except socket.error:
         # This might happen if the hostname is invalid, etc.
         # We'll print errors at the end to keep the progress bar clean
         pass
-    
-    # Return port number even on failure
-    return port, False, ""
+
+    return None
+
+
+def _probe_rtt(ip, port, family, cap=1.0):
+    """
+    Times one connect round-trip to a port. Both SYN-ACK and RST count —
+    either answer bounds the path RTT. Returns seconds, or None when the
+    probe got no reply within the cap (filtered).
+    """
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            _tune_socket(s)
+            s.setblocking(False)
+            start = time.monotonic()
+            err = s.connect_ex((ip, port))
+            if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                return time.monotonic() - start
+            sel = _get_selector()
+            sel.register(s, selectors.EVENT_WRITE)
+            try:
+                events = sel.select(cap)
+            finally:
+                sel.unregister(s)
+            if not events:
+                return None
+            return time.monotonic() - start
+    except socket.error:
+        return None
+
+
+def auto_timeout(ip, family, fallback):
+    """
+    Derives a connect timeout from measured RTTs instead of a fixed
+    default that can be 100x the real path latency: probes a few ports
+    likely to answer (open or RST), then takes 5x the median RTT with a
+    50 ms floor. Falls back to the -t value when every probe is silent
+    (fully filtered target).
+    """
+    probe_ports = (80, 22, 443, 33333, 45678)
+    rtts = sorted(
+        r for r in (_probe_rtt(ip, p, family) for p in probe_ports) if r is not None
+    )
+    if not rtts:
+        return fallback
+    return max(0.05, 5 * rtts[len(rtts) // 2])
+
+
+# --- ASYNC SCANNING LOGIC ---
+async def scan_port_async(ip, port, timeout, sem, family=socket.AF_INET):
+    """
+    Scans a single port using asyncio.open_connection.
+    The semaphore bounds how many connections are in flight at once,
+    so one thread can juggle thousands of sockets via the event loop.
+    Returns (port, banner) if the port is open, None otherwise.
+    """
+    async with sem:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, port, family=family), timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            # Closed, filtered, or unreachable
+            return None
+
+        try:
+            # Established socket: make sure close() RSTs instead of
+            # parking the connection in TIME_WAIT
+            sock = writer.get_extra_info('socket')
+            if sock is not None:
+                _tune_socket(sock)
+            # Some services send a banner immediately upon connection;
+            # the read gets its own (short) deadline, decoupled from the
+            # connect timeout
+            banner = ""
+            try:
+                data = await asyncio.wait_for(reader.read(1024), BANNER_TIMEOUT)
+                banner = data.decode(errors='ignore').strip()
+            except (OSError, asyncio.TimeoutError):
+                pass
+            return port, banner
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+async def scan_ports(ip, ports_to_scan, timeout, max_workers, progress, task, family=socket.AF_INET, table=None):
+    """
+    Drives scan_port_async over all ports, updating the progress bar and
+    streaming open ports into the live results table as each connection
+    attempt completes, so long scans show hits immediately.
+    Returns a list of (port, banner) tuples for open ports, in port
+    order; closed ports produce no result objects at all.
+    """
+    sem = asyncio.Semaphore(max_workers)
+    tasks = [
+        asyncio.create_task(scan_port_async(ip, port, timeout, sem, family))
+        for port in ports_to_scan
+    ]
+
+    # Ports are bounded, so bucket by port number instead of sorting:
+    # O(N) writes beat an O(N log N) sort over completion order
+    buckets = [None] * (max(ports_to_scan) + 1)
+    # Batch progress updates: every update takes Rich's render lock, so
+    # advancing per port would throttle completion on big scans
+    done = 0
+    for coro in asyncio.as_completed(tasks):
+        result = await coro
+        if result is not None:
+            buckets[result[0]] = result
+            if table is not None:
+                _record_open(table, result[0], result[1])
+        done += 1
+        if done % 64 == 0 or done == len(tasks):
+            progress.update(task, completed=done)
+    return [r for r in buckets if r is not None]
+
+
+def scan_ports_syn(ip, ports_to_scan, timeout, progress, task, table=None):
+    """
+    SYN-scan backend (like nmap -sS): fires raw SYN probes for the whole
+    port list in a single scapy sr() call and classifies the replies, so
+    no per-port socket is ever created and no handshake is completed.
+    Requires root and scapy. Returns a list of (port, banner) tuples for
+    open ports; banners are empty since no handshake is completed.
+    """
+    from scapy.all import IP, TCP, RandShort, sr
+
+    ports = list(ports_to_scan)
+    answered, _unanswered = sr(
+        IP(dst=ip) / TCP(sport=RandShort(), dport=ports, flags="S"),
+        timeout=timeout,
+        verbose=0,
+    )
+
+    open_ports = set()
+    for sent, received in answered:
+        # SYN/ACK means open; RST means closed; no reply means filtered
+        if received.haslayer(TCP) and received[TCP].flags & 0x12 == 0x12:
+            open_ports.add(sent[TCP].dport)
+
+    if table is not None:
+        for port in sorted(open_ports):
+            _record_open(table, port, "")
+    progress.update(task, completed=len(ports))
+    return [(port, "") for port in ports if port in open_ports]
+
+
+def _syn_scan_available():
+    """
+    Checks whether the SYN backend can run: raw sockets need root,
+    and scapy is an optional dependency.
+    """
+    if not hasattr(os, "geteuid") or os.geteuid() != 0:
+        console.print("[yellow]SYN scan needs root privileges; falling back to connect scan.[/yellow]")
+        return False
+    try:
+        import scapy.all  # noqa: F401
+    except ImportError:
+        console.print("[yellow]SYN scan needs scapy (pip install scapy); falling back to connect scan.[/yellow]")
+        return False
+    return True
+
+
+def _record_open(table, port, banner):
+    """Appends an open port to the live results table as it's found."""
+    table.add_row(str(port), _service_name(port), banner)
+
+
+def _scan_chunk(ip, chunk, timeout, family):
+    """
+    Scans a slice of ports sequentially inside one worker future and
+    returns only the open ones; closed ports yield nothing to ship back.
+    """
+    results = []
+    for port in chunk:
+        result = scan_port(ip, port, timeout, family)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def scan_ports_threaded(ip, ports_to_scan, timeout, max_workers, progress, task, family=socket.AF_INET, table=None):
+    """
+    Legacy thread-pool scanner, kept for environments where the asyncio
+    path is not wanted. Ports are submitted in chunks of up to 256 so a
+    65K-port sweep costs ~256 futures instead of 65K queue round-trips;
+    the chunk size shrinks for small scans so every worker stays busy.
+    Returns a list of (port, banner) tuples for open ports, in port
+    order.
+
+    Safe on free-threaded (no-GIL) CPython builds: workers share no
+    mutable state — scan_port only touches its own socket and selector,
+    _service_name's lru_cache is thread-safe — and all progress.update
+    calls stay on this (the consuming) thread.
+    """
+    ports = list(ports_to_scan)
+    # At least max_workers chunks, capped at 256 ports per chunk
+    chunk_size = max(1, min(256, -(-len(ports) // max_workers)))
+    chunks = [ports[i:i + chunk_size] for i in range(0, len(ports), chunk_size)]
+
+    # Bucket results by port number; linear writes replace a final sort
+    buckets = [None] * (max(ports) + 1)
+    # Use ThreadPoolExecutor to manage a pool of worker threads
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_size = {
+            executor.submit(_scan_chunk, ip, chunk, timeout, family): len(chunk)
+            for chunk in chunks
+        }
+
+        # Each completed future carries a whole chunk, so the per-future
+        # progress update is already batched
+        done = 0
+        for future in as_completed(future_to_size):
+            for result in future.result():
+                buckets[result[0]] = result
+                if table is not None:
+                    _record_open(table, result[0], result[1])
+            done += future_to_size[future]
+            progress.update(task, completed=done)
+    return [r for r in buckets if r is not None]
+
+
+def scan_batch(ip, port_batch, timeout, family=socket.AF_INET):
+    """
+    Probes a whole batch of ports from one thread: all sockets connect
+    non-blocking and register with a single selector, so one select()
+    wakeup handles every socket that became ready instead of one
+    selector round-trip per port.
+    Returns a list of (port, banner) tuples for the open ports found.
+    """
+    sel = selectors.DefaultSelector()
+    pending = {}
+    open_results = []
+    try:
+        for port in port_batch:
+            s = socket.socket(family, socket.SOCK_STREAM)
+            _tune_socket(s)
+            s.setblocking(False)
+            err = s.connect_ex((ip, port))
+            if err in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                sel.register(s, selectors.EVENT_WRITE, port)
+                pending[s] = port
+            else:
+                # Immediate failure (e.g. no route); nothing to wait for
+                s.close()
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Whatever never became writable is closed or filtered
+                break
+            for key, _ in sel.select(remaining):
+                s, port = key.fileobj, key.data
+                sel.unregister(s)
+                del pending[s]
+                # Writable means the connect finished; SO_ERROR says how
+                if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    open_results.append((port, get_banner(s)))
+                s.close()
+    finally:
+        for s in pending:
+            sel.unregister(s)
+            s.close()
+        sel.close()
+    return open_results
+
+
+def scan_ports_select(ip, ports_to_scan, timeout, batch_size, progress, task, family=socket.AF_INET, table=None):
+    """
+    Single-threaded selector backend: probes ports in batches of
+    batch_size concurrent sockets via scan_batch, so a full sweep costs
+    a handful of select syscalls per batch and no worker threads at all.
+    Returns a list of (port, banner) tuples for open ports, in port
+    order.
+    """
+    ports = list(ports_to_scan)
+    # Bucket results by port number; linear writes replace a final sort
+    buckets = [None] * (max(ports) + 1)
+    done = 0
+    for i in range(0, len(ports), batch_size):
+        batch = ports[i:i + batch_size]
+        for result in scan_batch(ip, batch, timeout, family):
+            buckets[result[0]] = result
+            if table is not None:
+                _record_open(table, result[0], result[1])
+        done += len(batch)
+        progress.update(task, completed=done)
+    return [r for r in buckets if r is not None]
 
 
 def main():
@@ -58,76 +491,91 @@ def main():
 
     # Add arguments
     parser.add_argument("target", help="The IP address or hostname to scan.")
-    parser.add_argument("-p", "--ports", default="1-1024", help="Port range to scan (e.g., '22-8080').")
+    parser.add_argument("-p", "--ports", default="1-1024", help="Ports to scan: a range/list like '22,80,8000-8080' or a preset (top20, top100, web).")
     parser.add_argument("-t", "--timeout", type=float, default=0.5, help="Connection timeout in seconds for each port.")
-    # --- NEW ARGUMENT for concurrency ---
-    parser.add_argument("-w", "--workers", type=int, default=100, help="Number of concurrent threads (workers) to use.")
+    parser.add_argument("--auto-timeout", action="store_true", help="Derive the timeout from measured RTT to the target (5x median, min 50 ms).")
+    # Workers now bound a semaphore, not OS threads, so the default can be high
+    parser.add_argument("-w", "--workers", type=int, default=1024, help="Number of concurrent connection attempts.")
+    parser.add_argument("--mode", choices=("async", "threaded", "sync", "syn"), default="async",
+                        help="Scan backend: asyncio event loop (default), thread pool, single-threaded "
+                             "selector batches ('sync'), or raw SYN probes (needs root and scapy).")
 
     # Parse the arguments provided by the user
     args = parser.parse_args()
 
-    target_ip = args.target
     port_range_str = args.ports
     timeout = args.timeout
     num_workers = args.workers
 
+    # Resolve the target once up front; connect_ex would otherwise run
+    # getaddrinfo for every single port probe. AF_UNSPEC lets dual-stack
+    # and IPv6-only targets resolve to whatever family they actually have.
+    try:
+        family, _, _, _, sockaddr = socket.getaddrinfo(
+            args.target, None, socket.AF_UNSPEC, socket.SOCK_STREAM)[0]
+        target_ip = sockaddr[0]
+    except socket.gaierror as e:
+        console.print(f"[bold red]Error: Could not resolve '{args.target}': {e}[/bold red]")
+        return
+
+    if args.auto_timeout:
+        timeout = auto_timeout(target_ip, family, timeout)
+
     # --- Script's main logic ---
-    console.print(f"\n[bold cyan]Scanning target:[/] [bright_magenta]{target_ip}[/bright_magenta]")
+    console.print(f"\n[bold cyan]Scanning target:[/] [bright_magenta]{args.target}[/bright_magenta] ([bright_magenta]{target_ip}[/bright_magenta])")
     console.print(f"[bold cyan]Port range:[/] [bright_magenta]{port_range_str}[/bright_magenta]")
-    console.print(f"[bold cyan]Worker threads:[/] [bright_magenta]{num_workers}[/bright_magenta]\n")
+    console.print(f"[bold cyan]Timeout:[/] [bright_magenta]{timeout * 1000:.0f} ms[/bright_magenta]")
+    console.print(f"[bold cyan]Concurrent probes:[/] [bright_magenta]{num_workers}[/bright_magenta]\n")
 
-    try:
-        # Parse the port range (e.g., '1-1024')
-        start_port, end_port = map(int, port_range_str.split('-'))
-        ports_to_scan = range(start_port, end_port + 1)
+    if port_range_str in PRESETS:
+        # Known presets skip parsing entirely
+        ports_to_scan = PRESETS[port_range_str]
         total_ports = len(ports_to_scan)
-    except ValueError:
-        console.print("[bold red]Error: Invalid port range format. Please use 'start-end'.[/bold red]")
-        return
+    else:
+        try:
+            # Parse the port specification (e.g., '1-1024' or '22,80,8000-8080')
+            ports_to_scan = parse_port_range(port_range_str)
+            total_ports = len(ports_to_scan)
+        except ValueError:
+            console.print("[bold red]Error: Invalid port specification. Use e.g. '1-1024', '22,80,8000-8080' or 'top100'.[/bold red]")
+            return
+
+    # Every in-flight probe holds a file descriptor
+    _raise_fd_limit(num_workers)
 
-    open_ports_data = []
+    # The scapy backend only speaks IPv4; other targets use connect scan
+    mode = args.mode
+    if mode == "syn":
+        if family != socket.AF_INET:
+            console.print("[yellow]SYN scan only supports IPv4 targets; falling back to connect scan.[/yellow]")
+            mode = "async"
+        elif not _syn_scan_available():
+            mode = "async"
+
+    # --- Live results table, filled in while the scan runs ---
+    table = Table(title=f"Open Ports on {target_ip}", show_header=True, header_style="bold magenta")
+    table.add_column("Port", justify="right", style="dim", width=12)
+    table.add_column("Service", style="cyan")
+    table.add_column("Banner", style="green")
+
+    progress = Progress(console=console)
+    task = progress.add_task("[green]Scanning ports...", total=total_ports)
 
     # --- CONCURRENT SCANNING LOGIC ---
-    with Progress(console=console) as progress:
-        task = progress.add_task("[green]Scanning ports...", total=total_ports)
-        
-        # Use ThreadPoolExecutor to manage a pool of worker threads
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            # Submit all scan_port tasks to the executor
-            # This creates a "future" object for each task
-            future_to_port = {executor.submit(scan_port, target_ip, port, timeout): port for port in ports_to_scan}
-            
-            # Process results as they are completed
-            for future in as_completed(future_to_port):
-                port, is_open, banner = future.result()
-                
-                if is_open:
-                    try:
-                        service = socket.getservbyport(port, 'tcp')
-                    except OSError:
-                        service = "Unknown"
-                    open_ports_data.append((port, service, banner))
-                
-                # Update the progress bar for each completed task
-                progress.update(task, advance=1)
-
-    # Sort the results by port number for clean output
-    open_ports_data.sort(key=lambda x: x[0])
-
-    # --- Display results in a beautiful table using rich ---
-    if open_ports_data:
-        table = Table(title=f"Open Ports on {target_ip}", show_header=True, header_style="bold magenta")
-        table.add_column("Port", justify="right", style="dim", width=12)
-        table.add_column("Service", style="cyan")
-        table.add_column("Banner", style="green")
-
-        for port, service, banner in open_ports_data:
-            table.add_row(str(port), service, banner)
-
-        console.print(table)
-    else:
+    # One Live drives both renderables, so hits appear the moment they
+    # complete instead of after the whole sweep
+    with Live(Group(table, progress), console=console, refresh_per_second=10):
+        if mode == "syn":
+            results = scan_ports_syn(target_ip, ports_to_scan, timeout, progress, task, table)
+        elif mode == "sync":
+            results = scan_ports_select(target_ip, ports_to_scan, timeout, min(num_workers, 1024), progress, task, family, table)
+        elif mode == "threaded":
+            results = scan_ports_threaded(target_ip, ports_to_scan, timeout, num_workers, progress, task, family, table)
+        else:
+            results = asyncio.run(scan_ports(target_ip, ports_to_scan, timeout, num_workers, progress, task, family, table))
+
+    if not results:
         console.print(f"\n[bold yellow]No open ports found in the range {port_range_str} on {target_ip}.[/bold yellow]")
 
 if __name__ == "__main__":
     main()
-